@@ -1,27 +1,94 @@
-import tkinter as tk
-from tkinter import filedialog, messagebox
-import pandas as pd
-from pdfrw import PdfReader, PdfWriter, PdfDict, PdfObject
+from pdfrw import PdfReader, PdfWriter, PdfObject
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import os
-import math
 import datetime
 import json
 
 ROWS_PER_PAGE = 7
 CONFIG_FILE = "de9c_defaults.json"
+MAX_FILL_WORKERS = 8
+# Roster rows parsed per CSV chunk
+CSV_CHUNK_SIZE = ROWS_PER_PAGE * 1024
+# Parsed roster optionally cached next to the CSV (needs pyarrow) for
+# faster re-runs
+ROSTER_CACHE_SUFFIX = ".de9c.parquet"
+# Parquet metadata key holding "<size>:<mtime_ns>" of the CSV it came from
+_CACHE_SOURCE_KEY = b"de9c.source"
+
+# CSV columns used to fill each employee row, in FIELD_MAP order
+CSV_COLUMNS = [
+    "SSN",
+    "First Name",
+    "Middle Name",
+    "Last Name",
+    "Total Subject Wages",
+    "PIT Wages",
+    "PIT Withheld",
+]
+MONEY_COLUMNS = ["Total Subject Wages", "PIT Wages", "PIT Withheld"]
+
+# Per-row field name patterns on the DE-9C template
+FIELD_MAP = {
+    "SSN": "SSN{suffix}",
+    "First": "First Name{suffix}",
+    "MI": "MI{suffix}",
+    "Last": "Last Name{suffix}",
+    "Wages": "Total Subject Wages{suffix}",
+    "PITWages": "PIT Wages{suffix}",
+    "Withheld": "PIT Withheld{suffix}",
+}
+
+# Field name suffix for each row on a page, indexed by row - 1
+_ROW_SUFFIXES = ("",) + tuple(str(i) for i in range(1, ROWS_PER_PAGE))
 
 
 # --------------------------------------------------------
 # Utility functions
 # --------------------------------------------------------
 
+# Characters dropped from money values ("$1,234.50" -> "1234.50")
+_MONEY_STRIP = str.maketrans("", "", "$,")
+
+
 def clean_money(x):
-    return str(x).replace("$", "").replace(",", "").strip()
+    return str(x).translate(_MONEY_STRIP).strip()
 
 
 def suffix_for_row(i: int) -> str:
     """Row 1 -> '', Row 2 -> '1', Row 3 -> '2', ..."""
-    return "" if i == 1 else str(i - 1)
+    if 1 <= i <= ROWS_PER_PAGE:
+        return _ROW_SUFFIXES[i - 1]
+    return str(i - 1)
+
+
+# Zero-padded month numbers for the month boxes, indexed by month - 1
+_MONTH_STRINGS = tuple(f"{m:02d}" for m in range(1, 13))
+
+# Row number -> {FIELD_MAP key: concrete field name}, resolved once
+FIELD_MAP_RESOLVED = {
+    r: {key: patt.format(suffix=_ROW_SUFFIXES[r - 1]) for key, patt in FIELD_MAP.items()}
+    for r in range(1, ROWS_PER_PAGE + 1)
+}
+
+# Row number -> every field name in that row, in FIELD_MAP order
+ROW_FIELDS = {
+    r: tuple(names.values()) for r, names in FIELD_MAP_RESOLVED.items()
+}
+
+# Header fields that hold the same value on every page; these keep their
+# names on cloned pages, every other field is renamed
+_SHARED_FIELDS = {
+    "Year",
+    "Quarter",
+    "Employer Account No",
+    "Date1",
+    "Date2",
+    "1st Month",
+    "2nd Month",
+    "3rd Month",
+    "Of Page number",
+}
 
 
 def calc_quarter_end(year_full: int, q: int) -> str:
@@ -54,8 +121,15 @@ def quarter_months(q: int):
 # Config (JSON) helpers
 # --------------------------------------------------------
 
+# Last parsed CONFIG_FILE contents, keyed by the file's (size, mtime_ns)
+_DEFAULTS_CACHE = {"key": None, "data": None}
+
+
 def load_defaults():
-    """Load defaults from JSON if present, otherwise return hard-coded defaults."""
+    """Load defaults from JSON if present, otherwise return hard-coded defaults.
+
+    The parsed file is cached until CONFIG_FILE's size or mtime changes.
+    """
     defaults = {
         "year": "2024",
         "quarter": "2",
@@ -65,6 +139,10 @@ def load_defaults():
         "signature_phone": "818-618-1851",
     }
     if os.path.isfile(CONFIG_FILE):
+        st = os.stat(CONFIG_FILE)
+        key = (st.st_size, st.st_mtime_ns)
+        if _DEFAULTS_CACHE["key"] == key:
+            return dict(_DEFAULTS_CACHE["data"])
         try:
             with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -72,6 +150,8 @@ def load_defaults():
         except Exception:
             # If anything goes wrong, fall back to built-in defaults
             pass
+        _DEFAULTS_CACHE["key"] = key
+        _DEFAULTS_CACHE["data"] = dict(defaults)
     return defaults
 
 
@@ -89,235 +169,367 @@ def save_defaults(year, quarter, account, sig_name, sig_title, sig_phone):
             json.dump(data, f, indent=2)
     except Exception as e:
         print("Warning: could not save defaults:", e)
+    finally:
+        # mtime resolution can be coarse; never trust the cache after a write
+        _DEFAULTS_CACHE["key"] = None
+        _DEFAULTS_CACHE["data"] = None
 
 
 # --------------------------------------------------------
-# Main DE-9C filling logic
+# Roster (CSV) loading
 # --------------------------------------------------------
 
-def fill_de9c(csv_path, template_path, output_path,
-              year_full, quarter, acct, quarter_end,
-              sig_name, sig_title, sig_phone, sig_date):
+def roster_cache_path(csv_path):
+    """Parquet cache written next to the roster CSV."""
+    return csv_path + ROSTER_CACHE_SUFFIX
 
-    # Load CSV
-    df = pd.read_csv(csv_path)
 
-    # Clean money fields
-    for col in ["Total Subject Wages", "PIT Wages", "PIT Withheld"]:
-        df[col] = df[col].astype(str).map(clean_money)
+def clear_roster_cache(csv_path):
+    """Delete the cached copy of csv_path; returns True if one existed."""
+    try:
+        os.remove(roster_cache_path(csv_path))
+    except FileNotFoundError:
+        return False
+    return True
 
-    # Build employee list
-    employees = []
-    for _, row in df.iterrows():
-        middle_raw = row.get("Middle Name", "")
-        if pd.isna(middle_raw):
-            middle_value = ""
-        else:
-            middle_value = str(middle_raw).strip()
-
-        employees.append(
-            [
-                row["SSN"],
-                row["First Name"],
-                middle_value,
-                row["Last Name"],
-                row["Total Subject Wages"],
-                row["PIT Wages"],
-                row["PIT Withheld"],
-            ]
-        )
 
-    num_employees = len(employees)
-    num_pages = math.ceil(num_employees / ROWS_PER_PAGE)
-
-    FIELD_MAP = {
-        "SSN": "SSN{suffix}",
-        "First": "First Name{suffix}",
-        "MI": "MI{suffix}",
-        "Last": "Last Name{suffix}",
-        "Wages": "Total Subject Wages{suffix}",
-        "PITWages": "PIT Wages{suffix}",
-        "Withheld": "PIT Withheld{suffix}",
-    }
+def _iter_roster_frames(csv_path, chunksize, use_cache=False):
+    """Yield raw roster chunks (CSV_COLUMNS, all str) for csv_path.
 
-    filled_pages = []
-    grand_w = grand_p = grand_h = 0.0
+    With use_cache, reads the parquet cache when it was written from this
+    exact CSV (same size and mtime); otherwise reads the CSV and writes
+    the cache as it goes. Without pyarrow there is no cache and the CSV
+    is always read.
+    """
+    import pandas as pd
 
-    # Month boxes based on quarter
-    m1, m2, m3 = quarter_months(quarter)
-    m1_str = f"{m1:02d}"
-    m2_str = f"{m2:02d}"
-    m3_str = f"{m3:02d}"
+    pa = pq = None
+    if use_cache:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            pass
 
-    for page_idx in range(num_pages):
-        start = page_idx * ROWS_PER_PAGE
-        page_emps = employees[start:start + ROWS_PER_PAGE]
+    cache_path = roster_cache_path(csv_path)
 
-        reader = PdfReader(template_path)
-        page = reader.pages[0]
-        annots = page.get("/Annots") or []
-        lookup = {a["/T"][1:-1]: a for a in annots if a.get("/T")}
+    if pq is not None:
+        st = os.stat(csv_path)
+        source_key = f"{st.st_size}:{st.st_mtime_ns}".encode()
 
-        # -------- Header fields --------
-        year2 = str(year_full)[-2:]
+    if pq is not None and os.path.isfile(cache_path):
+        try:
+            cached = pq.ParquetFile(cache_path)
+            meta = cached.schema_arrow.metadata or {}
+            if (meta.get(_CACHE_SOURCE_KEY) != source_key
+                    or not set(CSV_COLUMNS) <= set(cached.schema_arrow.names)):
+                raise ValueError("stale roster cache")
+            batches = cached.iter_batches(batch_size=chunksize,
+                                          columns=CSV_COLUMNS)
+            first = next(batches, None)
+        except Exception:
+            # Stale or unreadable cache: fall back to the CSV (which
+            # rewrites it)
+            cached = None
+        if cached is not None:
+            offset = 0
+            if first is not None:
+                for batch in itertools.chain([first], batches):
+                    df = batch.to_pandas()
+                    # Number rows across batches like read_csv chunks do
+                    df.index = pd.RangeIndex(offset, offset + len(df))
+                    offset += len(df)
+                    yield df
+            return
+
+    # Only the columns we fill, all read as plain strings
+    # (no type inference; blank cells stay "")
+    chunks = pd.read_csv(
+        csv_path,
+        engine="c",
+        usecols=lambda c: c in CSV_COLUMNS,
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunksize,
+    )
+
+    writer = None
+    tmp_path = cache_path + ".tmp"
+    if pq is not None:
+        schema = pa.schema(
+            [(col, pa.string()) for col in CSV_COLUMNS],
+            metadata={_CACHE_SOURCE_KEY: source_key},
+        )
+        try:
+            writer = pq.ParquetWriter(tmp_path, schema, compression="zstd")
+        except Exception as e:
+            print("Warning: could not write roster cache:", e)
 
-        if "Year" in lookup:
-            lookup["Year"].update(PdfDict(V=year2, AS=year2, AP=None))
+    completed = False
+    try:
+        with chunks:
+            for df in chunks:
+                missing = [
+                    col for col in CSV_COLUMNS
+                    if col not in df and col != "Middle Name"
+                ]
+                if missing:
+                    raise ValueError(
+                        "The CSV file is missing required column(s): "
+                        + ", ".join(missing)
+                    )
+
+                # Middle name is optional
+                if "Middle Name" not in df:
+                    df["Middle Name"] = ""
+                df = df.reindex(columns=CSV_COLUMNS)
+
+                if writer is not None:
+                    writer.write_table(
+                        pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                    )
+                yield df
+        completed = True
+    finally:
+        if writer is not None:
+            writer.close()
+            try:
+                # Only publish a cache that holds the whole roster
+                if completed:
+                    os.replace(tmp_path, cache_path)
+                else:
+                    os.remove(tmp_path)
+            except OSError as e:
+                print("Warning: could not write roster cache:", e)
+
+
+def _read_roster(csv_path, chunksize=CSV_CHUNK_SIZE, use_cache=False):
+    """Yield (employees, amounts) for successive chunks of the roster CSV.
+
+    employees is a list of CSV_COLUMNS rows (all str); amounts is an
+    (n, 3) float array of the MONEY_COLUMNS, with blank values as 0.
+    Raises ValueError listing the data rows (counted from 1, header
+    excluded) whose money values don't parse.
+    """
+    import pandas as pd
+
+    for df in _iter_roster_frames(csv_path, chunksize, use_cache):
+        # Clean money fields (same as clean_money, vectorized)
+        for col in MONEY_COLUMNS:
+            df[col] = df[col].str.translate(_MONEY_STRIP).str.strip()
+        df["Middle Name"] = df["Middle Name"].str.strip()
+
+        money = df[MONEY_COLUMNS]
+        numeric = money.apply(pd.to_numeric, errors="coerce")
+        bad = numeric.isna() & (money != "")
+        if bad.to_numpy().any():
+            raise ValueError(_bad_money_message(money, bad))
+
+        employees = df[CSV_COLUMNS].to_numpy(dtype=object).tolist()
+        amounts = numeric.fillna(0.0).to_numpy(dtype=float)
+        yield employees, amounts
+
+
+def _bad_money_message(money, bad, limit=10):
+    """Describe the unparseable money cells flagged in a roster chunk."""
+    flags = bad.stack()
+    problems = []
+    for idx, col in flags[flags].index:
+        # chunk index counts data rows from 0
+        problems.append(f"row {idx + 1}, {col}: {money.at[idx, col]!r}")
+
+    msg = (
+        "Invalid money value(s) in CSV "
+        "(rows are data rows, header excluded):\n"
+        + "\n".join(problems[:limit])
+    )
+    if len(problems) > limit:
+        msg += f"\n... and {len(problems) - limit} more"
+    return msg
+
+
+def _paginate(chunks):
+    """Split the roster chunks into a list of ROWS_PER_PAGE-row pages.
+
+    Each page is (employees, amounts). The whole roster is held in memory
+    (as row lists and one amounts array, not a DataFrame) because the page
+    count is needed before any page is filled.
+    """
+    import numpy as np
+
+    employees, amounts = [], []
+    for chunk_emps, chunk_amounts in chunks:
+        employees.extend(chunk_emps)
+        amounts.append(chunk_amounts)
+    if not employees:
+        return []
+
+    amounts = np.concatenate(amounts)
+    return [
+        (employees[start:start + ROWS_PER_PAGE],
+         amounts[start:start + ROWS_PER_PAGE])
+        for start in range(0, len(employees), ROWS_PER_PAGE)
+    ]
 
-        if "Quarter" in lookup:
-            lookup["Quarter"].update(PdfDict(V=str(quarter), AS=str(quarter), AP=None))
 
-        if "Employer Account No" in lookup:
-            lookup["Employer Account No"].update(
-                PdfDict(V=acct, AS=acct, AP=None)
-            )
+# --------------------------------------------------------
+# Main DE-9C filling logic
+# --------------------------------------------------------
 
-        # Quarter Ended (Date1)
-        if "Date1" in lookup:
-            lookup["Date1"].update(PdfDict(V=quarter_end, AS=quarter_end, AP=None))
-
-        # DUE (Date2) – same as quarter ended
-        if "Date2" in lookup:
-            lookup["Date2"].update(PdfDict(V=quarter_end, AS=quarter_end, AP=None))
-
-        # Month boxes
-        if "1st Month" in lookup:
-            lookup["1st Month"].update(PdfDict(V=m1_str, AS=m1_str, AP=None))
-        if "2nd Month" in lookup:
-            lookup["2nd Month"].update(PdfDict(V=m2_str, AS=m2_str, AP=None))
-        if "3rd Month" in lookup:
-            lookup["3rd Month"].update(PdfDict(V=m3_str, AS=m3_str, AP=None))
-
-        # Page numbering
-        pno = str(page_idx + 1)
-        tpages = str(num_pages)
-        if "Page number" in lookup:
-            lookup["Page number"].update(PdfDict(V=pno, AS=pno, AP=None))
-        if "Of Page number" in lookup:
-            lookup["Of Page number"].update(PdfDict(V=tpages, AS=tpages, AP=None))
-
-        # -------- Rows --------
-        page_w = page_p = page_h = 0.0
-
-        for r, emp in enumerate(page_emps, start=1):
-            suf = suffix_for_row(r)
-
-            data = {
-                "SSN": emp[0],
-                "First": emp[1],
-                "MI": emp[2],
-                "Last": emp[3],
-                "Wages": emp[4],
-                "PITWages": emp[5],
-                "Withheld": emp[6],
-            }
+def _set_field(annot, value):
+    """Write a text value into a form-field annotation.
+
+    Assigning None removes the stale /AP so the viewer regenerates it.
+    """
+    annot.V = value
+    annot.AS = value
+    annot.AP = None
+
+
+def _fill_one_page(page_idx, reader, field_slots, page_emps, page_amounts, hdr):
+    """Fill header, rows and page totals on one parsed template page.
+
+    Returns (reader, lookup, page_w, page_p, page_h). lookup maps the
+    template field names to the annotations of page 1; it is None for
+    the other pages.
+    """
+    annots = reader.pages[0].get("/Annots") or []
+    page_w, page_p, page_h = page_amounts.sum(axis=0)
+
+    # -------- Header fields --------
+    quarter_end = hdr["quarter_end"]
+    values = {
+        "Year": hdr["year2"],
+        "Quarter": hdr["qstr"],
+        "Employer Account No": hdr["acct"],
+        "Date1": quarter_end,  # Quarter Ended
+        "Date2": quarter_end,  # DUE – same as quarter ended
+        "1st Month": hdr["m1_str"],
+        "2nd Month": hdr["m2_str"],
+        "3rd Month": hdr["m3_str"],
+        "Page number": str(page_idx + 1),
+        "Of Page number": hdr["tpages"],
+        # -------- Page totals (I/J/K) --------
+        "Total Subject Wages This Page": f"{page_w:.2f}",
+        "Total PIT Wages This Page": f"{page_p:.2f}",
+        "Total PIT Withheld This Page": f"{page_h:.2f}",
+    }
 
-            try:
-                page_w += float(emp[4] or "0")
-            except Exception:
-                pass
+    # -------- Rows --------
+    # Employee rows are in CSV_COLUMNS order, which matches FIELD_MAP
+    for r, emp in enumerate(page_emps, start=1):
+        values.update(zip(ROW_FIELDS[r], emp))
+
+    # Clear unused rows on last page
+    for blank_row in range(len(page_emps) + 1, ROWS_PER_PAGE + 1):
+        values.update(dict.fromkeys(ROW_FIELDS[blank_row], ""))
+
+    # Single pass over the page's fields: write each value and, on cloned
+    # pages, rename every field except the shared header ones so they
+    # don't share form values with page 1 (grand totals and signature are
+    # only filled on page 1 and stay blank here).
+    lookup = {} if page_idx == 0 else None
+    suffix = f"__p{page_idx + 1}"
+    for i, name in field_slots:
+        annot = annots[i]
+        val = values.get(name)
+        if val is not None:
+            _set_field(annot, val)
+        if lookup is not None:
+            lookup[name] = annot
+        elif name not in _SHARED_FIELDS:
+            annot.T = PdfObject(f"({name}{suffix})")
+
+    return reader, lookup, page_w, page_p, page_h
 
-            try:
-                page_p += float(emp[5] or "0")
-            except Exception:
-                pass
 
-            try:
-                page_h += float(emp[6] or "0")
-            except Exception:
-                pass
-
-            for key, val in data.items():
-                fname = FIELD_MAP[key].format(suffix=suf)
-                if fname in lookup:
-                    lookup[fname].update(PdfDict(V=str(val), AS=str(val), AP=None))
-
-        # Clear unused rows on last page
-        for blank_row in range(len(page_emps) + 1, ROWS_PER_PAGE + 1):
-            suf = suffix_for_row(blank_row)
-            for patt in FIELD_MAP.values():
-                fname = patt.format(suffix=suf)
-                if fname in lookup:
-                    lookup[fname].update(PdfDict(V="", AS="", AP=None))
-
-        # Rename page field names (except the first page) so cloned pages
-        # don't share the same field names/form values.
-        if page_idx > 0:
-            suffix = f"__p{page_idx + 1}"
-            for annot in annots:
-                field_name = annot.get("/T")
-                if not field_name:
-                    continue
-                original = field_name[1:-1]
-                annot.update(PdfDict(T=PdfObject(f"({original}{suffix})")))
+def fill_de9c(csv_path, template_path, output_path,
+              year_full, quarter, acct, quarter_end,
+              sig_name, sig_title, sig_phone, sig_date, use_cache=False):
 
-        # -------- Page totals (I/J/K) --------
-        if "Total Subject Wages This Page" in lookup:
-            txt = f"{page_w:.2f}"
-            lookup["Total Subject Wages This Page"].update(
-                PdfDict(V=txt, AS=txt, AP=None)
-            )
-        if "Total PIT Wages This Page" in lookup:
-            txt = f"{page_p:.2f}"
-            lookup["Total PIT Wages This Page"].update(
-                PdfDict(V=txt, AS=txt, AP=None)
-            )
-        if "Total PIT Withheld This Page" in lookup:
-            txt = f"{page_h:.2f}"
-            lookup["Total PIT Withheld This Page"].update(
-                PdfDict(V=txt, AS=txt, AP=None)
-            )
+    # Read the roster chunk by chunk (never as one full DataFrame) and
+    # split it into form pages
+    pages = _paginate(_read_roster(csv_path, use_cache=use_cache))
+    num_pages = len(pages)
+    if num_pages == 0:
+        raise ValueError("The CSV file has no employee rows.")
+
+    # Month boxes based on quarter
+    m1, m2, m3 = quarter_months(quarter)
+    # Header values shared by every page, stringified once
+    hdr = {
+        "year2": str(year_full)[-2:],
+        "qstr": str(quarter),
+        "acct": acct,
+        "quarter_end": quarter_end,
+        "m1_str": _MONTH_STRINGS[m1 - 1],
+        "m2_str": _MONTH_STRINGS[m2 - 1],
+        "m3_str": _MONTH_STRINGS[m3 - 1],
+        "tpages": str(num_pages),
+    }
+
+    # Read the template from disk once; every page is parsed from these bytes
+    # so each clone gets its own independent set of annotation objects.
+    with open(template_path, "rb") as f:
+        template_bytes = f.read()
+
+    # (annotation index, field name) pairs; identical for every parse of the
+    # template, so they are collected from the first page only.
+    first_reader = PdfReader(fdata=template_bytes)
+    first_annots = first_reader.pages[0].get("/Annots") or []
+    field_slots = [
+        (i, a["/T"][1:-1]) for i, a in enumerate(first_annots) if a.get("/T")
+    ]
+
+    def fill_page(page_idx):
+        # Page 1 keeps the reader parsed above; the others parse their own copy
+        if page_idx == 0:
+            reader = first_reader
+        else:
+            reader = PdfReader(fdata=template_bytes)
+        page_emps, page_amounts = pages[page_idx]
+        return _fill_one_page(
+            page_idx, reader, field_slots, page_emps, page_amounts, hdr
+        )
+
+    # Pages are independent, so they are filled concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_FILL_WORKERS, num_pages)) as pool:
+        results = list(pool.map(fill_page, range(num_pages)))
 
+    filled_pages = []
+    grand_w = grand_p = grand_h = 0.0
+    for reader, _, page_w, page_p, page_h in results:
         grand_w += page_w
         grand_p += page_p
         grand_h += page_h
-
         filled_pages.append(reader)
 
     # -------- Grand totals & signature on Page 1 --------
-    first_reader = filled_pages[0]
-    first_page = first_reader.pages[0]
-    annots = first_page.get("/Annots") or []
-    lookup = {a["/T"][1:-1]: a for a in annots if a.get("/T")}
-
-    # Grand totals L/M/N
-    if "Grand Total Subject Wages" in lookup:
-        txt = f"{grand_w:.2f}"
-        lookup["Grand Total Subject Wages"].update(
-            PdfDict(V=txt, AS=txt, AP=None)
-        )
-    if "Grand Total PIT Wages" in lookup:
-        txt = f"{grand_p:.2f}"
-        lookup["Grand Total PIT Wages"].update(
-            PdfDict(V=txt, AS=txt, AP=None)
-        )
-    if "Grand Total PIT Withheld" in lookup:
-        txt = f"{grand_h:.2f}"
-        lookup["Grand Total PIT Withheld"].update(
-            PdfDict(V=txt, AS=txt, AP=None)
-        )
-
-    # Signature block – your PDF uses these internal names:
-    # Signature1 = Signature
-    # Text2      = Title
-    # Text3      = Phone
-    # 0          = Date
-    sig_map = {
-        "Signature1": sig_name,
-        "0": sig_title,                  # Title field
-        "Phone Number": sig_phone,       # Phone
-        "Date5": sig_date,               # Date
-    }
-
-    for fname, val in sig_map.items():
-        if fname in lookup:
-            lookup[fname].update(PdfDict(V=val, AS=val, AP=None))
+    first_page_lookup = results[0][1]
+
+    page1_writes = [
+        # Grand totals L/M/N
+        ("Grand Total Subject Wages", f"{grand_w:.2f}"),
+        ("Grand Total PIT Wages", f"{grand_p:.2f}"),
+        ("Grand Total PIT Withheld", f"{grand_h:.2f}"),
+        # Signature block – your PDF uses these internal names:
+        # Signature1 = Signature
+        # Text2      = Title
+        # Text3      = Phone
+        # 0          = Date
+        ("Signature1", sig_name),
+        ("0", sig_title),                # Title field
+        ("Phone Number", sig_phone),     # Phone
+        ("Date5", sig_date),             # Date
+    ]
+    for fname, val in page1_writes:
+        annot = first_page_lookup.get(fname)
+        if annot is not None:
+            _set_field(annot, val)
 
     # Ensure appearances are regenerated
     if hasattr(first_reader, "Root") and first_reader.Root.AcroForm:
-        first_reader.Root.AcroForm.update(
-            PdfDict(NeedAppearances=PdfObject("true"))
-        )
+        first_reader.Root.AcroForm.NeedAppearances = PdfObject("true")
 
     # -------- Merge & write --------
     writer = PdfWriter()
@@ -328,7 +540,10 @@ def fill_de9c(csv_path, template_path, output_path,
     if hasattr(first_reader, "Root") and first_reader.Root.AcroForm:
         final_trailer.Root.AcroForm = first_reader.Root.AcroForm
 
-    writer.write(output_path, trailer=final_trailer)
+    # pdfrw emits many small writes; a 1 MB buffer holds a typical DE-9C
+    # output whole, so it reaches the disk in a single flush.
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        writer.write(f, trailer=final_trailer)
 
 
 # --------------------------------------------------------
@@ -336,6 +551,11 @@ def fill_de9c(csv_path, template_path, output_path,
 # --------------------------------------------------------
 
 def run_gui():
+    # Tk is only needed for the GUI; importing it lazily keeps
+    # programmatic use of fill_de9c free of the Tcl/Tk startup cost
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+
     root = tk.Tk()
     root.title("DE-9C Autofill Tool")
     root.geometry("680x760")
@@ -357,6 +577,7 @@ def run_gui():
     phone_var = tk.StringVar(value=defaults["signature_phone"])
     today = datetime.date.today().strftime("%m/%d/%y")
     date_var = tk.StringVar(value=today)
+    cache_var = tk.BooleanVar(value=False)  # opt-in roster cache
 
     # Browse helpers
     def browse_csv():
@@ -374,6 +595,15 @@ def run_gui():
         if path:
             out_var.set(path)
 
+    def clear_cache():
+        if not csv_var.get():
+            messagebox.showerror("Error", "Please select a CSV file.")
+            return
+        if clear_roster_cache(csv_var.get()):
+            messagebox.showinfo("Cache", "Cached roster removed.")
+        else:
+            messagebox.showinfo("Cache", "No cached roster for this CSV.")
+
     def run_fill():
         try:
             if not csv_var.get():
@@ -405,6 +635,7 @@ def run_gui():
                 title_var.get(),
                 phone_var.get(),
                 date_var.get(),
+                use_cache=cache_var.get(),
             )
 
             # Save current values as defaults
@@ -462,6 +693,24 @@ def run_gui():
         fg="white",
         height=2,
     ).grid(row=row, column=0, columnspan=3, pady=20)
+    row += 1
+
+    tk.Checkbutton(
+        frame,
+        text=f"Cache parsed CSV for faster re-runs "
+             f"(<csv>{ROSTER_CACHE_SUFFIX}, needs pyarrow)",
+        variable=cache_var,
+    ).grid(row=row, column=0, columnspan=3)
+    tk.Label(
+        frame,
+        text="The cache holds a copy of the SSNs and wages; "
+             "clear it when you are done.",
+        fg="gray",
+    ).grid(row=row + 1, column=0, columnspan=3)
+    row += 2
+    tk.Button(frame, text="Clear Cache", command=clear_cache).grid(
+        row=row, column=0, columnspan=3, pady=5
+    )
 
     root.mainloop()
 